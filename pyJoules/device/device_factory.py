@@ -20,7 +20,6 @@
 
 from typing import List, Optional
 import logging
-from operator import add
 from . import Domain, Device
 from .rapl_device import RaplDevice
 try:
@@ -31,7 +30,7 @@ except ImportError:
 
 from ..exception import NoSuchDeviceError
 
-from functools import reduce
+from itertools import chain
 
 
 class DeviceFactory:
@@ -47,7 +46,7 @@ class DeviceFactory:
                 available_domains.append(api.available_domains())
             except NoSuchDeviceError:
                 pass
-        flaten_available_domain_list = reduce(add, available_domains, [])
+        flaten_available_domain_list = list(chain.from_iterable(available_domains))
         return flaten_available_domain_list
 
     @staticmethod
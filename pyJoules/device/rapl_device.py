@@ -82,6 +82,9 @@ class RaplPackageDomain(RaplDomain):
 
 RAPL_API_DIR = '/sys/class/powercap/intel-rapl'
 
+# an energy_uj file contains at most a 20 digits counter followed by a new line
+ENERGY_VALUE_MAX_SIZE = 32
+
 
 class RaplDevice(Device):
     """
@@ -94,6 +97,7 @@ class RaplDevice(Device):
         """
         Device.__init__(self)
         self._api_file_names = None
+        self._api_files = []
 
     @staticmethod
     def _rapl_api_available():
@@ -207,14 +211,24 @@ class RaplDevice(Device):
     def _collect_domain_api_file_name(self, domain_list):
         return [self._get_domain_file_name(domain) for domain in domain_list]
 
+    def _close_api_files(self):
+        for api_file in self._api_files:
+            api_file.close()
+        self._api_files = []
+
     def configure(self, domains=None):
         Device.configure(self, domains)
 
         self._api_file_names = self._collect_domain_api_file_name(self._configured_domains)
+        # api files are opened once and rewinded before each read to avoid opening and closing them at each
+        # measure
+        self._close_api_files()
+        self._api_files = [open(api_file_name, 'rb', buffering=0) for api_file_name in self._api_file_names]
 
     def _read_energy_value(self, api_file):
-        return float(api_file.readline())
+        api_file.seek(0)
+        return float(api_file.read(ENERGY_VALUE_MAX_SIZE))
 
     def get_energy(self):
-        energies = [self._read_energy_value(open(api_file_name, 'r')) for api_file_name in self._api_file_names]
+        energies = [self._read_energy_value(api_file) for api_file in self._api_files]
         return energies
@@ -18,10 +18,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import time
-import operator
 import functools
 
-from functools import reduce
+from array import array
+from itertools import chain
+from operator import sub
 from typing import List, Optional, Dict
 
 from .exception import PyJoulesException
@@ -29,17 +30,6 @@ from .device import Device, Domain, DeviceFactory
 from .handler import EnergyHandler, PrintHandler
 from .energy_trace import EnergySample, EnergyTrace
 
-class NoNextStateException(PyJoulesException):
-    """Exception raised when trying to compute duration or energy from a state
-    which is the last state of an energy trace.
-    """
-
-
-class StateIsNotFinalError(PyJoulesException):
-    """Exception raised when trying to add a state to a non final state on an energy trace
-    """
-
-
 class EnergyMeterNotStartedError(PyJoulesException):
     """
     Exception raised when trying to stop or record on a non started EnergyMeter instance
@@ -62,37 +52,50 @@ class EnergyMeter:
     """
     Tool used to record the energy consumption of given devices
     """
+    __slots__ = ('devices', 'default_tag', '_min_period_ns', '_domain_names', '_get_energies', '_states',
+                 '_stopped')
 
-    def __init__(self, devices: List[Device], default_tag: str = ''):
+    def __init__(self, devices: List[Device], default_tag: str = '', min_period_ns: int = 0):
         """
         :param devices: list of the monitored devices
         :param default_tag: tag given if no tag were given to a measure
+        :param min_period_ns: minimal duration of a sample, in nanoseconds. A record made less than this duration
+                              after the previous state only change the tag of the previous state instead of measuring
+                              a new one. 0 to measure a new state at each record
+        :raise NotConfiguredDeviceException: if one of the given devices was not configured
         """
         self.devices = devices
         self.default_tag = default_tag
+        self._min_period_ns = min_period_ns
+        # devices are configured before the meter creation, their domain names are cached to avoid querying and
+        # converting them again for each sample
+        self._domain_names = tuple(str(domain) for domain in self._get_domain_list())
+        self._get_energies = tuple(device.get_energy for device in devices)
 
-        self._last_state = None
-        self._first_state = None
+        self._states = []
+        self._stopped = False
 
-    def _measure_new_state(self, tag):
-        timestamp = time.time()
-        values = [device.get_energy() for device in self.devices]
+    def _measure_new_state(self, tag, sentinel=False):
+        timestamp = time.time_ns()
+        values = array('d')
+        for get_energy in self._get_energies:
+            values.extend(get_energy())
 
-        return EnergyState(timestamp, tag if tag is not None else self.default_tag, values)
+        return EnergyState(timestamp, tag if tag is not None else self.default_tag, values, sentinel)
 
     def _append_new_state(self, new_state):
-        self._last_state.add_next_state(new_state)
-        self._last_state = new_state
+        self._states.append(new_state)
+        self._stopped = False
 
     def _is_meter_started(self):
-        return not self._first_state is None
+        return len(self._states) > 0
 
-    def _is_meter_stoped(self):
-        return self._last_state.tag == '__stop__'
+    def _is_in_min_period(self):
+        return not self._stopped and time.time_ns() - self._states[-1].timestamp < self._min_period_ns
 
     def _reinit(self):
-        self._first_state = None
-        self._last_state = None
+        self._states = []
+        self._stopped = False
 
     def start(self, tag: Optional[str] = None):
         """
@@ -101,8 +104,8 @@ class EnergyMeter:
         :param tag: sample name
         """
         new_state = self._measure_new_state(tag)
-        self._first_state = new_state
-        self._last_state = new_state
+        self._states = [new_state]
+        self._stopped = False
 
     def record(self, tag: Optional[str] = None):
         """
@@ -114,6 +117,10 @@ class EnergyMeter:
         if not self._is_meter_started():
             raise EnergyMeterNotStartedError()
 
+        if self._min_period_ns and self._is_in_min_period():
+            self._states[-1].tag = tag if tag is not None else self.default_tag
+            return
+
         new_state = self._measure_new_state(tag)
         self._append_new_state(new_state)
 
@@ -127,7 +134,7 @@ class EnergyMeter:
         if not self._is_meter_started():
             return self.start(tag)
         
-        if not self._is_meter_stoped():
+        if not self._stopped:
             raise EnergyMeterNotStoppedError()
 
         new_state = self._measure_new_state(tag)
@@ -142,8 +149,9 @@ class EnergyMeter:
         if not self._is_meter_started():
             raise EnergyMeterNotStartedError()
 
-        new_state = self._measure_new_state('__stop__')
+        new_state = self._measure_new_state('__stop__', sentinel=True)
         self._append_new_state(new_state)
+        self._stopped = True
 
     def get_trace(self) -> EnergyTrace:
         """
@@ -154,20 +162,38 @@ class EnergyMeter:
         if not self._is_meter_started():
             return EnergyTrace([])
 
-        if not self._is_meter_stoped():
+        if not self._stopped:
             raise EnergyMeterNotStoppedError()
 
         return self._generate_trace()
 
+    def flush_to(self, handler: EnergyHandler):
+        """
+        send the last trace measured to the given handler in one batch, using the
+        :py:meth:`pyJoules.handler.EnergyHandler.process_batch` method. Contrary to :py:meth:`get_trace`, no
+        EnergySample is created for the samples of the trace
+
+        :param handler: handler instance that will receive the power consummation data
+        :raise EnergyMeterNotStoppedError: if the energy meter isn't stopped
+        """
+        if not self._is_meter_started():
+            handler.process_batch([], [], [], self._domain_names, [])
+            return
+
+        if not self._stopped:
+            raise EnergyMeterNotStoppedError()
+
+        generator = TraceGenerator(self._states, self._domain_names)
+        handler.process_batch(*generator.generate_batch())
+
     def _get_domain_list(self):
         """
         return the list of all monitored domains for each monitored energy devices
         """
-        return reduce(operator.add, [device.get_configured_domains() for device in self.devices])
+        return tuple(chain.from_iterable(device.get_configured_domains() for device in self.devices))
 
     def _generate_trace(self):
-        domains = self._get_domain_list()
-        generator = TraceGenerator(self._first_state, domains)
+        generator = TraceGenerator(self._states, self._domain_names)
         return generator.generate()
 
     def gen_idle(self, trace: EnergyTrace) -> List[Dict[str, float]]:
@@ -192,90 +218,108 @@ class EnergyMeter:
 
 
 class TraceGenerator:
+    __slots__ = ('domain_names', '_states')
 
-    def __init__(self, first_state, domains):
-        self.domains = domains
-        self._current_state = first_state
+    def __init__(self, states, domain_names):
+        self.domain_names = domain_names
+        self._states = states
+
+    def _iter_sample_states(self):
+        """
+        iterate on the couples of states that begin and end each sample of the trace
+        """
+        for i in range(len(self._states) - 1):
+            state = self._states[i]
+            if state.sentinel:
+                continue
+            yield state, self._states[i + 1]
 
     def generate(self):
-        def generate_next(current_state, samples):
-            if current_state.next_state is None:
-                return samples
-            if current_state.tag == '__stop__':
-                return generate_next(current_state.next_state, samples)
+        samples = [self._gen_sample(state, next_state) for state, next_state in self._iter_sample_states()]
+        return EnergyTrace(samples)
 
-            sample = self._gen_sample(current_state)
-            samples.append(sample)
-            return generate_next(current_state.next_state, samples)
+    def generate_batch(self):
+        """
+        :return: the timestamps, tags, durations, domain names and energy values of the samples of the trace, as
+                 expected by the :py:meth:`pyJoules.handler.EnergyHandler.process_batch` method
+        """
+        timestamps = []
+        tags = []
+        durations = []
+        energies = []
+        for state, next_state in self._iter_sample_states():
+            timestamps.append(state.timestamp / 1000000000)
+            tags.append(state.tag)
+            durations.append(state.compute_duration(next_state))
+            energies.append(array('d', map(sub, next_state.values, state.values)))
+        return timestamps, tags, durations, self.domain_names, energies
+
+    def _gen_sample(self, state, next_state):
+        return LazyEnergySample(state, next_state, self.domain_names)
+
+
+class LazyEnergySample(EnergySample):
+    """
+    Internal class used to generate energy samples from two energy states. The energy consumed during the sample is
+    only computed the first time it is accessed
+    """
+    __slots__ = ('_state', '_next_state', '_domain_names')
 
-        samples = generate_next(self._current_state, [])
-        return EnergyTrace(samples)
+    def __init__(self, state: 'EnergyState', next_state: 'EnergyState', domain_names):
+        """
+        :param state: state measured at the beginning of the sample
+        :param next_state: state measured at the end of the sample
+        :param domain_names: names of the monitored domains, in the same order than the state values
+        """
+        EnergySample.__init__(self, state.timestamp / 1000000000, state.tag, state.compute_duration(next_state), None)
+        self._state = state
+        self._next_state = next_state
+        self._domain_names = domain_names
 
-    def _gen_sample(self, state):
-        return EnergySample(state.timestamp, state.tag, state.compute_duration(), state.compute_energy(self.domains))
+    @EnergySample.energy.getter
+    def energy(self) -> Dict[str, float]:
+        if self._energy is None:
+            self._energy = self._state.compute_energy(self._next_state, self._domain_names)
+            self._state = None
+            self._next_state = None
+        return self._energy
 
 
 class EnergyState:
     """
     Internal class that record the current energy state of the monitored device
     """
+    __slots__ = ('timestamp', 'tag', 'values', 'sentinel')
 
-    def __init__(self, timestamp: float, tag: str, values: List[Dict[str, float]]):
+    def __init__(self, timestamp: int, tag: str, values: array, sentinel: bool = False):
         """
-        :param timstamp: timestamp of the measure
+        :param timstamp: timestamp of the measure in nanoseconds
         :param tag: tag of the measure
-        :param values: energy consumption measure, this is the list of measured energy consumption values for each
-                       monitored device. This list contains the energy consumption since the last device reset to the
-                       end of this sample
+        :param values: energy consumption measure, this is the flat array of measured energy consumption values for
+                       each domain of each monitored device, in the device order. This array contains the energy
+                       consumption since the last device reset to the end of this sample
+        :param sentinel: True if the state was measured when stopping the meter. A sentinel state only ends the
+                         previous sample, no sample begins with it
         """
         self.timestamp = timestamp
         self.tag = tag
         self.values = values
-        self.next_state = None
+        self.sentinel = sentinel
 
-    def is_last(self) -> bool:
+    def compute_duration(self, next_state: 'EnergyState') -> float:
         """
-        indicate if the current state is the last state of the trace or not
-         :return: True if the current state is the last state of the trace False otherwise
+        :param next_state: state measured after the current state
+        :return: compute the time elipsed between the current state and the next state in seconds
         """
-        return self.next_state is None
+        return (next_state.timestamp - self.timestamp) / 1000000000
 
-    def compute_duration(self) -> float:
-        """
-        :return: compute the time elipsed between the current state and the next state
-        :raise NoNextStateException: if the state is the last state of the trace
-        """
-        if self.next_state is None:
-            raise NoNextStateException()
-
-        return self.next_state.timestamp - self.timestamp
-
-    def compute_energy(self, domains) -> List[float]:
+    def compute_energy(self, next_state: 'EnergyState', domain_names) -> Dict[str, float]:
         """
+        :param next_state: state measured after the current state
+        :param domain_names: names of the monitored domains, in the same order than the state values
         :return: compute the energy consumed between the current state and the next state
-        :raise NoNextStateException: if the state is the last state of the trace
-        """
-        if self.next_state is None:
-            raise NoNextStateException()
-
-        energy = []
-        for next_state_device, current_state_device in zip(self.next_state.values, self.values):
-            for next_value, current_value in zip(next_state_device, current_state_device):
-                energy.append(next_value - current_value)
-
-        values_dict = {}
-        for value, key in zip(energy, domains):
-            values_dict[str(key)] = value
-        return values_dict
-
-    def add_next_state(self, state: 'EnergyState'):
-        """
-        :param previous: next state for the same energy trace
-        :raise StateIsNotFinalError: if there are already a next state
         """
-        if self.next_state is not None:
-            raise StateIsNotFinalError()
-        self.next_state = state
+        return dict(zip(domain_names, map(sub, next_state.values, self.values)))
 
 
 def measure_energy(func=None ,handler: EnergyHandler = PrintHandler(), domains: Optional[List[Domain]] = None):
@@ -33,11 +33,21 @@ class EnergySample:
     :var energy: dictionary that contains the energy consumed during this sample
     :vartype energy: Dict[str, float]
     """
+    __slots__ = ('timestamp', 'tag', 'duration', '_energy')
+
     def __init__(self, timestamp: float, tag: str, duration: float, energy: Dict[str, float]):
         self.timestamp = timestamp
         self.tag = tag
         self.duration = duration
-        self.energy = energy
+        self._energy = energy
+
+    @property
+    def energy(self) -> Dict[str, float]:
+        return self._energy
+
+    @energy.setter
+    def energy(self, energy: Dict[str, float]):
+        self._energy = energy
 
 
 class EnergyTrace:
@@ -48,14 +58,20 @@ class EnergyTrace:
         """
         :param samples: samples containing in the trace
         """
-        self._samples = []
-        for sample in samples:
-            self._samples.append(sample)
+        self._samples = list(samples)
+        # position of the first sample of each tag, to retrieve samples by tag without iterating on the trace
+        self._tag_index = {}
+        self._index_samples(0)
+
+    def _index_samples(self, begin_position):
+        for position in range(begin_position, len(self._samples)):
+            self._tag_index.setdefault(self._samples[position].tag, position)
 
     def _get_sample_from_tag(self, tag):
-        for sample in self._samples:
-            if sample.tag == tag:
-                return sample
+        position = self._tag_index.get(tag)
+        if position is None:
+            return None
+        return self._samples[position]
 
     def __getitem__(self, key: Any) -> EnergySample:
         """
@@ -96,7 +112,9 @@ class EnergyTrace:
         return EnergyTrace(samples)
 
     def __iadd__(self, trace: 'EnergySample'):
+        begin_position = len(self._samples)
         self._samples += trace._samples
+        self._index_samples(begin_position)
         return self
 
     def append(self, sample: EnergySample):
@@ -104,6 +122,7 @@ class EnergyTrace:
         append a new sample to the trace
         """
         self._samples.append(sample)
+        self._tag_index.setdefault(sample.tag, len(self._samples) - 1)
 
     def remove_idle(self, idle: List[Dict[str, float]]):
         """
@@ -147,3 +166,5 @@ class EnergyTrace:
             if reduce(and_, validity_list):
                 valid_samples.append(sample)
         self._samples = valid_samples
+        self._tag_index = {}
+        self._index_samples(0)
@@ -18,7 +18,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from ..energy_trace import EnergyTrace
+from typing import List, Sequence
+
+from ..energy_trace import EnergyTrace, EnergySample
 
 
 class UnconsistantSamplesError(Exception):
@@ -52,6 +54,23 @@ class EnergyHandler:
         """
         self.traces.append(trace)
 
+    def process_batch(self, timestamps: List[float], tags: List[str], durations: List[float],
+                      domain_names: Sequence[str], energies: List[Sequence[float]]):
+        """
+        process a whole trace given as parallel lists, one value per sample. The default implementation build an
+        EnergyTrace from the given values and process it with the :py:meth:`process` method. Handlers that can use
+        the raw values should override this method
+
+        :param timestamps: beginning timestamp of each sample, in seconds
+        :param tags: tag of each sample
+        :param durations: duration of each sample, in seconds
+        :param domain_names: names of the monitored domains
+        :param energies: energy consumed during each sample, for each domain in the same order than domain_names
+        """
+        samples = [EnergySample(timestamp, tag, duration, dict(zip(domain_names, energy)))
+                   for timestamp, tag, duration, energy in zip(timestamps, tags, durations, energies)]
+        self.process(EnergyTrace(samples))
+
     def _flaten_trace(self):
         flatened_trace = EnergyTrace([])
         for trace in self.traces:
@@ -34,17 +34,11 @@ from ..utils.fake_api import CorrectTrace
 from ..utils.sample import assert_sample_are_equals
 
 
-# We mock time.time function that is used by pyfakefs each time an operation on filesystem is done. we have to give
-# consistant time return value to time.time that will be used by pyfakefs
-INIT_TS = [0] * 5
-FIRST_TS = [1.1] * 7
-SECOND_TS = [2.2] * 7
-THIRD_TS = [3.3] * 7
-MOCKED_TIMESTAMP_TRACE = INIT_TS + FIRST_TS + SECOND_TS + THIRD_TS
-TIMESTAMP_TRACE = [1.1, 2.2, 3.3]
+TIMESTAMP_TRACE = [1.5, 2.25, 3.125]
+MOCKED_TIMESTAMP_TRACE = [int(ts * 1000000000) for ts in TIMESTAMP_TRACE]
 
 
-@patch('time.time', side_effect=MOCKED_TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=MOCKED_TIMESTAMP_TRACE)
 def test_measure_rapl_device_all_domains(_mocked_time_ns, fs_pkg_dram_one_socket, one_gpu_api):
     domains = [RaplPackageDomain(0), RaplDramDomain(0), NvidiaGPUDomain(0)]
 
@@ -71,7 +65,7 @@ def test_measure_rapl_device_all_domains(_mocked_time_ns, fs_pkg_dram_one_socket
         assert_sample_are_equals(sample1, sample2)  # test
 
 
-@patch('time.time', side_effect=MOCKED_TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=MOCKED_TIMESTAMP_TRACE)
 def test_measure_rapl_device_all_domains_configuration_with_factory(_mocked_time_ns, fs_pkg_dram_one_socket, one_gpu_api):
     domains = [RaplPackageDomain(0), RaplDramDomain(0), NvidiaGPUDomain(0)]
 
@@ -94,10 +88,7 @@ def test_measure_rapl_device_all_domains_configuration_with_factory(_mocked_time
         assert_sample_are_equals(sample1, sample2)  # test
 
 
-INIT_TS2 = [0] * 9
-MOCKED_TIMESTAMP_TRACE2 = INIT_TS2 + FIRST_TS + SECOND_TS + THIRD_TS
-
-@patch('time.time', side_effect=MOCKED_TIMESTAMP_TRACE2)
+@patch('time.time_ns', side_effect=MOCKED_TIMESTAMP_TRACE)
 def test_measure_rapl_device_all_domains_configuration_with_factory_with_default_values(_mocked_time_ns, fs_pkg_dram_one_socket, one_gpu_api):
     domains = [RaplPackageDomain(0), RaplDramDomain(0), NvidiaGPUDomain(0)]
 
@@ -35,16 +35,10 @@ from .. utils.fake_api import CorrectTrace
 from ..utils.sample import assert_sample_are_equals
 
 
-# We mock time.time function that is used by pyfakefs each time an operation on filesystem is done. we have to give
-# consistant time return value to time.time that will be used by pyfakefs
-FIRST_TS = [1.1] * 12
-SECOND_TS = [2.2] * 7
-THIRD_TS = [3.3] * 7
-CSV_WRITING_TS = [1] * 3
-MOCKED_TIMESTAMP_TRACE = FIRST_TS + SECOND_TS + THIRD_TS + CSV_WRITING_TS
-TIMESTAMP_TRACE = [1.1, 2.2, 3.3]
+TIMESTAMP_TRACE = [1.5, 2.25, 3.125]
+MOCKED_TIMESTAMP_TRACE = [int(ts * 1000000000) for ts in TIMESTAMP_TRACE]
 
-@patch('time.time', side_effect=MOCKED_TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=MOCKED_TIMESTAMP_TRACE)
 @patch('pyJoules.handler.EnergyHandler')
 def test_measure_rapl_device_all_domains(mocked_handler, _mocked_time, fs_pkg_dram_one_socket, one_gpu_api):
     print('init--------------')
@@ -237,3 +237,31 @@ def test_get_package0_and_all_dram_energy_with_pkg_dram_rapl_api_two_sockets_ret
     assert device.get_energy() == [fs_pkg_dram_two_socket.domains_current_energy['package_0'],
                                    fs_pkg_dram_two_socket.domains_current_energy['dram_0'],
                                    fs_pkg_dram_two_socket.domains_current_energy['dram_1']]
+
+
+def test_get_package_energy_two_times_with_pkg_rapl_api_return_updated_value(fs_pkg_one_socket):
+    """
+    Create a RaplDevice instance on a machine with package rapl api with on one socket
+    configure it to monitor package domain
+    use the `get_energy` method, update the energy value and use the `get_energy` method again and check if:
+    - the second returned list contains the updated power consumption of the package on socket 0
+    """
+    device = RaplDevice()
+    device.configure([RaplPackageDomain(0)])
+    device.get_energy()
+    fs_pkg_one_socket.reset_values()
+    assert device.get_energy() == [fs_pkg_one_socket.domains_current_energy['package_0']]
+
+
+def test_configure_device_two_times_and_get_energy_return_values_of_the_last_configured_domains(fs_pkg_dram_one_socket):
+    """
+    Create a RaplDevice instance on a machine with package and dram rapl api with on one socket
+    configure it to monitor package domain then configure it to monitor dram domain
+    use the `get_energy` method and check if:
+    - the returned list contains one element
+    - this element is the power consumption of the dram on socket 0
+    """
+    device = RaplDevice()
+    device.configure([RaplPackageDomain(0)])
+    device.configure([RaplDramDomain(0)])
+    assert device.get_energy() == [fs_pkg_dram_one_socket.domains_current_energy['dram_0']]
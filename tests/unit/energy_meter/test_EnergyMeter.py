@@ -25,6 +25,7 @@ from pyJoules.energy_meter import EnergyMeter, EnergySample
 from pyJoules.energy_meter import EnergyMeterNotStartedError, EnergyMeterNotStoppedError, SampleNotFoundError
 from pyJoules.device import Device, Domain
 from pyJoules.energy_trace import EnergyTrace
+from pyJoules.handler import EnergyHandler
 from ...utils.sample import assert_sample_are_equals
 
 DEVICE1_ENERGY_TRACE = [[1.0, 1.1],
@@ -39,7 +40,7 @@ DEVICE2_ENERGY_TRACE = [[4.0],
                         [10.3],
                         [11.123]]
 
-TIMESTAMP_TRACE = [1.1, 3.2, 3.3, 4.4, 5.5]
+TIMESTAMP_TRACE = [1100000000, 3200000000, 3300000000, 4400000000, 5500000000]
 
 
 class DomainDevice1Domain1(Domain):
@@ -124,9 +125,9 @@ def test_resume_a_non_stoped_energy_meter_raise_EnergyMeterNotStoppedError(energ
 ####################
 @pytest.fixture
 def sample1():
-    ts = TIMESTAMP_TRACE[0]
+    ts = TIMESTAMP_TRACE[0] / 1000000000
     tag = ''
-    duration = TIMESTAMP_TRACE[1] - TIMESTAMP_TRACE[0]
+    duration = (TIMESTAMP_TRACE[1] - TIMESTAMP_TRACE[0]) / 1000000000
     energy = {str(DomainDevice1Domain1()): DEVICE1_ENERGY_TRACE[1][0] - DEVICE1_ENERGY_TRACE[0][0],
               str(DomainDevice1Domain2()): DEVICE1_ENERGY_TRACE[1][1] - DEVICE1_ENERGY_TRACE[0][1],
               str(DomainDevice2Domain1()): DEVICE2_ENERGY_TRACE[1][0] - DEVICE2_ENERGY_TRACE[0][0]}
@@ -135,9 +136,9 @@ def sample1():
 
 @pytest.fixture
 def sample2():
-    ts = TIMESTAMP_TRACE[1]
+    ts = TIMESTAMP_TRACE[1] / 1000000000
     tag = ''
-    duration = TIMESTAMP_TRACE[2] - TIMESTAMP_TRACE[1]
+    duration = (TIMESTAMP_TRACE[2] - TIMESTAMP_TRACE[1]) / 1000000000
     energy = {str(DomainDevice1Domain1()): DEVICE1_ENERGY_TRACE[2][0] - DEVICE1_ENERGY_TRACE[1][0],
               str(DomainDevice1Domain2()): DEVICE1_ENERGY_TRACE[2][1] - DEVICE1_ENERGY_TRACE[1][1],
               str(DomainDevice2Domain1()): DEVICE2_ENERGY_TRACE[2][0] - DEVICE2_ENERGY_TRACE[1][0]}
@@ -146,9 +147,9 @@ def sample2():
 
 @pytest.fixture
 def sample2_5():
-    ts = TIMESTAMP_TRACE[2]
+    ts = TIMESTAMP_TRACE[2] / 1000000000
     tag = ''
-    duration = TIMESTAMP_TRACE[3] - TIMESTAMP_TRACE[2]
+    duration = (TIMESTAMP_TRACE[3] - TIMESTAMP_TRACE[2]) / 1000000000
     energy = {str(DomainDevice1Domain1()): DEVICE1_ENERGY_TRACE[3][0] - DEVICE1_ENERGY_TRACE[2][0],
               str(DomainDevice1Domain2()): DEVICE1_ENERGY_TRACE[3][1] - DEVICE1_ENERGY_TRACE[2][1],
               str(DomainDevice2Domain1()): DEVICE2_ENERGY_TRACE[3][0] - DEVICE2_ENERGY_TRACE[2][0]}
@@ -157,9 +158,9 @@ def sample2_5():
 
 @pytest.fixture
 def sample3():
-    ts = TIMESTAMP_TRACE[3]
+    ts = TIMESTAMP_TRACE[3] / 1000000000
     tag = ''
-    duration = TIMESTAMP_TRACE[4] - TIMESTAMP_TRACE[3]
+    duration = (TIMESTAMP_TRACE[4] - TIMESTAMP_TRACE[3]) / 1000000000
     energy = {str(DomainDevice1Domain1()): DEVICE1_ENERGY_TRACE[4][0] - DEVICE1_ENERGY_TRACE[3][0],
               str(DomainDevice1Domain2()): DEVICE1_ENERGY_TRACE[4][1] - DEVICE1_ENERGY_TRACE[3][1],
               str(DomainDevice2Domain1()): DEVICE2_ENERGY_TRACE[4][0] - DEVICE2_ENERGY_TRACE[3][0]}
@@ -172,11 +173,19 @@ def test_get_trace_on_a_non_stopped_energy_meter_raise_EnergyMeterNotStoppedErro
         energy_meter.get_trace()
 
 
+def test_get_trace_on_a_stopped_energy_meter_after_a_record_raise_EnergyMeterNotStoppedError(energy_meter):
+    energy_meter.start()
+    energy_meter.stop()
+    energy_meter.record()
+    with pytest.raises(EnergyMeterNotStoppedError):
+        energy_meter.get_trace()
+
+
 def test_get_trace_on_a_non_started_energy_meter_return_empty_trace(energy_meter):
         assert len(energy_meter.get_trace()) == 0
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_and_stop_EnergyMeter_should_return_one_sample_trace(_mocked_fun, energy_meter):
     energy_meter.start()
     energy_meter.stop()
@@ -184,7 +193,7 @@ def test_start_and_stop_EnergyMeter_should_return_one_sample_trace(_mocked_fun,
     assert len(energy_meter.get_trace()) == 1
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_and_stop_EnergyMeter_should_return_correct_values(_mocked_fun, energy_meter, sample1):
     energy_meter.start()
     energy_meter.stop()
@@ -193,7 +202,7 @@ def test_start_and_stop_EnergyMeter_should_return_correct_values(_mocked_fun, en
         assert_sample_are_equals(sample, sample1)
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_resume_and_stop_EnergyMeter_should_return_one_sample_trace(_mocked_fun, energy_meter):
     energy_meter.resume()
     energy_meter.stop()
@@ -201,7 +210,7 @@ def test_resume_and_stop_EnergyMeter_should_return_one_sample_trace(_mocked_fun,
     assert len(energy_meter.get_trace()) == 1
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_resume_and_stop_EnergyMeter_should_return_correct_values(_mocked_fun, energy_meter, sample1):
     energy_meter.resume()
     energy_meter.stop()
@@ -210,7 +219,7 @@ def test_resume_and_stop_EnergyMeter_should_return_correct_values(_mocked_fun, e
         assert_sample_are_equals(sample, sample1)
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_record_and_stop_EnergyMeter_should_return_two_sample_trace(_mocked_fun, energy_meter):
     energy_meter.start()
     energy_meter.record()
@@ -219,7 +228,7 @@ def test_start_record_and_stop_EnergyMeter_should_return_two_sample_trace(_mocke
     assert len(energy_meter.get_trace())
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_record_and_stop_EnergyMeter_should_return_correct_values(_mocked_fun, energy_meter, sample1, sample2):
     energy_meter.start()
     energy_meter.record()
@@ -229,7 +238,7 @@ def test_start_record_and_stop_EnergyMeter_should_return_correct_values(_mocked_
         assert_sample_are_equals(sample, correct_sample)
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_stop_resume_stop_EnergyMeter_should_return_two_sample_trace(_mocked_fun, energy_meter):
     energy_meter.start()
     energy_meter.stop()
@@ -239,7 +248,7 @@ def test_start_stop_resume_stop_EnergyMeter_should_return_two_sample_trace(_mock
     assert len(energy_meter.get_trace()) == 2
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_stop_resume_and_stop_EnergyMeter_should_return_correct_values(_mocked_fun, energy_meter, sample1, sample2_5):
     energy_meter.start()
     energy_meter.stop()
@@ -250,7 +259,7 @@ def test_start_stop_resume_and_stop_EnergyMeter_should_return_correct_values(_mo
         assert_sample_are_equals(sample, correct_sample)
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_record_stop_resume_stop_EnergyMeter_should_return_three_sample_trace(_mocked_fun, energy_meter):
     energy_meter.start()
     energy_meter.record()
@@ -261,7 +270,7 @@ def test_start_record_stop_resume_stop_EnergyMeter_should_return_three_sample_tr
     assert len(energy_meter.get_trace()) == 3
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_start_record_stop_resume_and_stop_EnergyMeter_should_return_correct_values(_mocked_fun, energy_meter, sample1, sample2, sample3):
     energy_meter.start()
     energy_meter.record()
@@ -273,7 +282,7 @@ def test_start_record_stop_resume_and_stop_EnergyMeter_should_return_correct_val
         assert_sample_are_equals(sample, correct_sample)
 
 
-@patch('time.time', side_effect=TIMESTAMP_TRACE)
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
 def test_second_start_on_an_energy_meter_should_restart_the_trace(_mocked_fun, energy_meter, sample3):
     energy_meter.start()
     energy_meter.record()
@@ -289,6 +298,51 @@ def test_second_start_on_an_energy_meter_should_restart_the_trace(_mocked_fun, e
     assert_sample_are_equals(samples[0], sample3)
 
 
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
+def test_record_with_stop_tag_should_not_be_considered_as_the_end_of_the_trace(_mocked_fun, energy_meter):
+    energy_meter.start()
+    energy_meter.record(tag='__stop__')
+    energy_meter.stop()
+
+    trace = energy_meter.get_trace()
+    assert len(trace) == 2
+    assert trace[1].tag == '__stop__'
+
+
+############
+# FLUSH_TO #
+############
+def test_flush_to_on_a_non_stopped_energy_meter_raise_EnergyMeterNotStoppedError(energy_meter):
+    energy_meter.start()
+    with pytest.raises(EnergyMeterNotStoppedError):
+        energy_meter.flush_to(EnergyHandler())
+
+
+def test_flush_to_on_a_non_started_energy_meter_process_empty_trace(energy_meter):
+    handler = EnergyHandler()
+    energy_meter.flush_to(handler)
+
+    assert len(handler.traces) == 1
+    assert len(handler.traces[0]) == 0
+
+
+@patch('time.time_ns', side_effect=TIMESTAMP_TRACE)
+def test_start_record_and_stop_EnergyMeter_and_flush_to_handler_should_process_correct_values(_mocked_fun,
+                                                                                              energy_meter, sample1,
+                                                                                              sample2):
+    energy_meter.start()
+    energy_meter.record()
+    energy_meter.stop()
+
+    handler = EnergyHandler()
+    energy_meter.flush_to(handler)
+
+    assert len(handler.traces) == 1
+    assert len(handler.traces[0]) == 2
+    for sample, correct_sample in zip(handler.traces[0], [sample1, sample2]):
+        assert_sample_are_equals(sample, correct_sample)
+
+
 ############
 # TEST TAG #
 ############
@@ -309,6 +363,42 @@ def test_define_energy_meter_with_default_tag_create_sample_with_default_tag():
     assert sample.tag == 'tag'
 
 
+##############
+# MIN PERIOD #
+##############
+@pytest.fixture
+def energy_meter_with_min_period():
+    device1 = MockedDevice1()
+    device1.configure()
+    device2 = MockedDevice2()
+    device2.configure()
+    return EnergyMeter([device1, device2], min_period_ns=500000000)
+
+
+@patch('time.time_ns', side_effect=[1000000000, 1200000000, 3000000000])
+def test_record_before_min_period_should_not_create_a_new_sample(_mocked_fun, energy_meter_with_min_period):
+    energy_meter_with_min_period.start(tag='foo')
+    energy_meter_with_min_period.record(tag='bar')
+    energy_meter_with_min_period.stop()
+
+    trace = energy_meter_with_min_period.get_trace()
+    assert len(trace) == 1
+    assert trace[0].tag == 'bar'
+    assert trace[0].duration == 2.0
+
+
+@patch('time.time_ns', side_effect=[1000000000, 2000000000, 2000000000, 3000000000])
+def test_record_after_min_period_should_create_a_new_sample(_mocked_fun, energy_meter_with_min_period):
+    energy_meter_with_min_period.start(tag='foo')
+    energy_meter_with_min_period.record(tag='bar')
+    energy_meter_with_min_period.stop()
+
+    trace = energy_meter_with_min_period.get_trace()
+    assert len(trace) == 2
+    assert trace[0].tag == 'foo'
+    assert trace[1].tag == 'bar'
+
+
 ############
 # GEN_IDLE #
 ############
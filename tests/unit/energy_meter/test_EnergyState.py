@@ -20,11 +20,13 @@
 
 import pytest
 
-from pyJoules.energy_meter import EnergyState, NoNextStateException, StateIsNotFinalError
+from array import array
 
+from pyJoules.energy_meter import EnergyState
 
-TS_FIRST = 1.0
-TS_SECOND = 2.0
+
+TS_FIRST = 1000000000
+TS_SECOND = 2000000000
 
 E_FIRST_DOMAIN0 = 1.0
 E_FIRST_DOMAIN1 = 7.2
@@ -34,58 +36,24 @@ E_SECOND_DOMAIN1 = 9.4
 
 
 @pytest.fixture
-def alone_state():
-    return EnergyState(TS_FIRST, 'first', [[E_FIRST_DOMAIN0, E_FIRST_DOMAIN1]])
+def first_state():
+    return EnergyState(TS_FIRST, 'first', array('d', [E_FIRST_DOMAIN0, E_FIRST_DOMAIN1]))
 
 
 @pytest.fixture
-def two_states(alone_state):
-    state2 = EnergyState(TS_SECOND, 'second', [[E_SECOND_DOMAIN0, E_SECOND_DOMAIN1]])
-    alone_state.add_next_state(state2)
-    return alone_state
-
-
-###########
-# IS_LAST #
-###########
-def test_new_state_are_last_sate_of_trace(alone_state):
-    assert alone_state.is_last()
-
-
-def test_add_a_state_to_new_state_make_it_not_being_last_state_of_trace(alone_state):
-    assert alone_state.is_last()
-    alone_state.add_next_state(EnergyState(1, 'second', [1, 1]))
-    assert not alone_state.is_last()
+def second_state():
+    return EnergyState(TS_SECOND, 'second', array('d', [E_SECOND_DOMAIN0, E_SECOND_DOMAIN1]))
 
 
 ###########
 # COMPUTE #
 ###########
-def test_compute_duration_from_last_state_raise_NoNextStateException(alone_state):
-    with pytest.raises(NoNextStateException):
-        alone_state.compute_duration()
+def test_compute_duration_between_two_state_return_correct_values(first_state, second_state):
+    assert first_state.compute_duration(second_state) == (TS_SECOND - TS_FIRST) / 1000000000
 
 
-def test_compute_energy_from_last_state_raise_NoNextStateException(alone_state):
-    with pytest.raises(NoNextStateException):
-        alone_state.compute_energy([])
-
-
-def test_compute_duration_between_two_state_return_correct_values(two_states):
-    print(two_states.next_state)
-    assert two_states.compute_duration() == TS_SECOND - TS_FIRST
-
-
-def test_compute_energy_between_two_state_return_correct_values(two_states):
-    energy = two_states.compute_energy(['domain0', 'domain1'])
+def test_compute_energy_between_two_state_return_correct_values(first_state, second_state):
+    energy = first_state.compute_energy(second_state, ['domain0', 'domain1'])
     assert len(energy) == 2
     assert energy['domain0'] == E_SECOND_DOMAIN0 - E_FIRST_DOMAIN0
     assert energy['domain1'] == E_SECOND_DOMAIN1 - E_FIRST_DOMAIN1
-
-
-##################
-# ADD_NEXT_STATE #
-##################
-def test_add_a_state_to_non_final_state_raise_StateIsNotFinalError(two_states):
-    with pytest.raises(StateIsNotFinalError):
-        two_states.add_next_state(EnergyState(1, 'third', [1, 2]))
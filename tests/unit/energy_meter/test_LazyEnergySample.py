@@ -0,0 +1,71 @@
+# MIT License
+# Copyright (c) 2019, INRIA
+# Copyright (c) 2019, University of Lille
+# All rights reserved.
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from array import array
+
+from pyJoules.energy_meter import EnergyState, LazyEnergySample
+
+
+TS_FIRST = 1000000000
+TS_SECOND = 3500000000
+
+E_FIRST_DOMAIN0 = 1.0
+E_FIRST_DOMAIN1 = 7.2
+
+E_SECOND_DOMAIN0 = 2.0
+E_SECOND_DOMAIN1 = 9.4
+
+DOMAIN_NAMES = ['domain0', 'domain1']
+
+
+@pytest.fixture
+def sample():
+    state1 = EnergyState(TS_FIRST, 'first', array('d', [E_FIRST_DOMAIN0, E_FIRST_DOMAIN1]))
+    state2 = EnergyState(TS_SECOND, 'second', array('d', [E_SECOND_DOMAIN0, E_SECOND_DOMAIN1]))
+    return LazyEnergySample(state1, state2, DOMAIN_NAMES)
+
+
+def test_create_sample_return_first_state_timestamp_in_second(sample):
+    assert sample.timestamp == TS_FIRST / 1000000000
+
+
+def test_create_sample_return_first_state_tag(sample):
+    assert sample.tag == 'first'
+
+
+def test_create_sample_return_duration_between_the_two_states(sample):
+    assert sample.duration == (TS_SECOND - TS_FIRST) / 1000000000
+
+
+def test_get_energy_return_energy_consumed_between_the_two_states(sample):
+    assert sample.energy == {'domain0': E_SECOND_DOMAIN0 - E_FIRST_DOMAIN0,
+                             'domain1': E_SECOND_DOMAIN1 - E_FIRST_DOMAIN1}
+
+
+def test_modify_energy_values_are_kept_on_next_access(sample):
+    sample.energy['domain0'] -= 1
+    assert sample.energy['domain0'] == E_SECOND_DOMAIN0 - E_FIRST_DOMAIN0 - 1
+
+
+def test_set_energy_replace_computed_values(sample):
+    sample.energy = {'domain0': 0}
+    assert sample.energy == {'domain0': 0}
@@ -183,6 +183,22 @@ def test_get_sample_on_a_two_sample_trace_with_same_names_return_first_sample():
     assert trace['tag1'] == s1
 
 
+def test_append_sample_to_a_trace_and_get_its_tag_must_return_appended_sample(trace_with_one_sample):
+    trace_with_one_sample.append(SAMPLE_2)
+    assert trace_with_one_sample['tag2'] == SAMPLE_2
+
+
+def test_iadd_a_trace_to_a_trace_and_get_tag_of_the_added_sample_must_return_added_sample(trace_with_one_sample):
+    trace_with_one_sample += EnergyTrace([SAMPLE_2])
+    assert trace_with_one_sample['tag2'] == SAMPLE_2
+
+
+def test_clean_trace_and_get_tag_of_a_removed_sample_must_raise_KeyError(semi_negative_trace):
+    semi_negative_trace.clean_data()
+    with pytest.raises(KeyError):
+        semi_negative_trace['tag2']
+
+
 ###########
 # ITERATE #
 ###########